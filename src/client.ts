@@ -2,8 +2,27 @@
  * API client for Malaysian government data APIs.
  */
 
-const OPENDOSM_BASE_URL = "https://api.data.gov.my/opendosm";
-const DATA_CATALOGUE_BASE_URL = "https://api.data.gov.my/data-catalogue";
+import { Agent } from "undici";
+
+const BASE_URL = "https://api.data.gov.my";
+const OPENDOSM_BASE_URL = `${BASE_URL}/opendosm`;
+const DATA_CATALOGUE_BASE_URL = `${BASE_URL}/data-catalogue`;
+
+// Both endpoints live on the same host, so a shared pool with generous
+// keep-alive lets concurrent tool calls reuse warm connections instead of
+// paying a fresh TCP+TLS handshake per request. HTTP/2 lets parallel
+// requests multiplex over a single connection. The agent is passed per
+// request rather than installed globally so embedders keep control of
+// their own fetch dispatcher.
+const agent = new Agent({
+    connections: 100,
+    keepAliveTimeout: 300_000,
+    keepAliveMaxTimeout: 300_000,
+    connectTimeout: 10_000,
+    headersTimeout: 30_000,
+    bodyTimeout: 30_000,
+    allowH2: true,
+});
 
 export interface QueryOptions {
     filters?: Record<string, unknown>;
@@ -12,19 +31,63 @@ export interface QueryOptions {
     metaOnly?: boolean;
 }
 
+/**
+ * Metadata envelope returned by meta_only=true queries. The shape varies
+ * per dataset, so only the stable fields are named and the rest stay
+ * open-ended.
+ */
+export interface DatasetMeta {
+    data_as_of?: string;
+    last_updated?: string;
+    next_update?: string;
+    fields?: Array<{ name?: string; type?: string; description?: string }>;
+    [key: string]: unknown;
+}
+
+export function isDatasetMeta(value: unknown): value is DatasetMeta {
+    return value !== null && typeof value === "object" && !Array.isArray(value);
+}
+
+const CACHE_MAX_ENTRIES = 512;
+const CACHE_TTL_MS = 300_000;
+// Responses larger than this are served but never cached, so a handful of
+// huge queries can't pin megabytes in a long-running server.
+const CACHE_MAX_ENTRY_BYTES = 512 * 1024;
+
+interface CacheEntry {
+    expiresAt: number;
+    bytes: number;
+    data: unknown;
+}
+
+export interface CacheStats {
+    entries: number;
+    bytes: number;
+    hits: number;
+    misses: number;
+}
+
+/**
+ * `nocache: true` in filters is a client-side directive to bypass the
+ * response cache; it is stripped before the request goes upstream.
+ */
+function wantsNoCache(filters?: Record<string, unknown>): boolean {
+    return Boolean(filters?.nocache);
+}
+
 /**
  * Client for querying OpenDOSM and Data Catalogue APIs.
  */
 export class DataGovMyClient {
     private abortController: AbortController | null = null;
+    private responseCache = new Map<string, CacheEntry>();
+    private inflight = new Map<string, Promise<unknown>>();
+    private combinedMetaSupport = new Map<string, boolean>();
+    private cacheBytes = 0;
+    private cacheHits = 0;
+    private cacheMisses = 0;
 
-    /**
-     * Query an OpenDOSM dataset.
-     */
-    async queryOpenDOSM(
-        datasetId: string,
-        options: QueryOptions = {}
-    ): Promise<unknown> {
+    private buildParams(datasetId: string, options: QueryOptions): URLSearchParams {
         const { filters, limit = 100, offset = 0, metaOnly = false } = options;
 
         const params = new URLSearchParams({ id: datasetId });
@@ -38,26 +101,173 @@ export class DataGovMyClient {
 
         if (filters) {
             Object.entries(filters).forEach(([key, value]) => {
+                if (key === "nocache") {
+                    return;
+                }
                 params.append(key, String(value));
             });
         }
 
+        return params;
+    }
+
+    private cacheGet(key: string): unknown {
+        const entry = this.responseCache.get(key);
+        if (!entry) {
+            this.cacheMisses++;
+            return undefined;
+        }
+        if (Date.now() > entry.expiresAt) {
+            this.cacheDelete(key);
+            this.cacheMisses++;
+            return undefined;
+        }
+        // Re-insert so the Map's insertion order doubles as LRU order
+        this.responseCache.delete(key);
+        this.responseCache.set(key, entry);
+        this.cacheHits++;
+        return entry.data;
+    }
+
+    private cacheSet(key: string, data: unknown, bytes: number) {
+        if (bytes > CACHE_MAX_ENTRY_BYTES) {
+            return;
+        }
+        // Release the bytes of any live entry being replaced so the
+        // running total stays accurate.
+        this.cacheDelete(key);
+        if (this.responseCache.size >= CACHE_MAX_ENTRIES) {
+            const oldest = this.responseCache.keys().next().value;
+            if (oldest !== undefined) {
+                this.cacheDelete(oldest);
+            }
+        }
+        this.responseCache.set(key, {
+            expiresAt: Date.now() + CACHE_TTL_MS,
+            bytes,
+            data,
+        });
+        this.cacheBytes += bytes;
+    }
+
+    private cacheDelete(key: string) {
+        const entry = this.responseCache.get(key);
+        if (entry) {
+            this.cacheBytes -= entry.bytes;
+            this.responseCache.delete(key);
+        }
+    }
+
+    private async request(
+        baseUrl: string,
+        apiName: string,
+        params: URLSearchParams,
+        skipCache = false
+    ): Promise<unknown> {
+        // Sorting the params gives a canonical cache key regardless of
+        // filter insertion order.
+        params.sort();
+        const url = `${baseUrl}?${params.toString()}`;
+
+        if (!skipCache) {
+            const cached = this.cacheGet(url);
+            if (cached !== undefined) {
+                return cached;
+            }
+
+            // Singleflight: concurrent identical requests share one
+            // network call instead of each issuing their own.
+            const pending = this.inflight.get(url);
+            if (pending) {
+                return pending;
+            }
+        }
+
+        const promise = this.fetchJson(url, apiName)
+            .then(({ data, bytes }) => {
+                if (!skipCache) {
+                    this.cacheSet(url, data, bytes);
+                }
+                return data;
+            })
+            .finally(() => {
+                // Only remove the entry this promise registered; a
+                // finishing nocache request shares the URL key but was
+                // never stored and must not evict another caller's entry.
+                if (this.inflight.get(url) === promise) {
+                    this.inflight.delete(url);
+                }
+            });
+
+        if (!skipCache) {
+            this.inflight.set(url, promise);
+        }
+
+        return promise;
+    }
+
+    private async fetchJson(
+        url: string,
+        apiName: string
+    ): Promise<{ data: unknown; bytes: number }> {
         this.abortController = new AbortController();
-        const url = `${OPENDOSM_BASE_URL}?${params.toString()}`;
         const response = await fetch(url, {
+            dispatcher: agent,
             signal: this.abortController.signal,
             headers: {
                 "Accept": "application/json",
+                // Repetitive JSON compresses 5-10x; prefer brotli, fall
+                // back to gzip/deflate. fetch decompresses transparently.
+                "Accept-Encoding": "br, gzip, deflate",
             },
         });
 
         if (!response.ok) {
             throw new Error(
-                `OpenDOSM API error: ${response.status} ${response.statusText}`
+                `${apiName} API error: ${response.status} ${response.statusText}`
             );
         }
 
-        return response.json();
+        // Buffer the body once and hand it straight to V8's native JSON
+        // parser, which is the fast path for multi-MB dataset payloads.
+        const body = await response.text();
+        return { data: JSON.parse(body), bytes: Buffer.byteLength(body) };
+    }
+
+    /**
+     * Current response-cache counters, for operators inspecting a
+     * long-running server.
+     */
+    cacheStats(): CacheStats {
+        return {
+            entries: this.responseCache.size,
+            bytes: this.cacheBytes,
+            hits: this.cacheHits,
+            misses: this.cacheMisses,
+        };
+    }
+
+    /**
+     * Drop all cached responses. Hit/miss counters are kept.
+     */
+    clearCache() {
+        this.responseCache.clear();
+        this.cacheBytes = 0;
+    }
+
+    /**
+     * Query an OpenDOSM dataset.
+     */
+    async queryOpenDOSM(
+        datasetId: string,
+        options: QueryOptions = {}
+    ): Promise<unknown> {
+        return this.request(
+            OPENDOSM_BASE_URL,
+            "OpenDOSM",
+            this.buildParams(datasetId, options),
+            wantsNoCache(options.filters)
+        );
     }
 
     /**
@@ -67,39 +277,104 @@ export class DataGovMyClient {
         datasetId: string,
         options: QueryOptions = {}
     ): Promise<unknown> {
-        const { filters, limit = 100, offset = 0, metaOnly = false } = options;
+        return this.request(
+            DATA_CATALOGUE_BASE_URL,
+            "Data Catalogue",
+            this.buildParams(datasetId, options),
+            wantsNoCache(options.filters)
+        );
+    }
 
-        const params = new URLSearchParams({ id: datasetId });
+    /**
+     * Fetch only the metadata envelope for a dataset, typed as
+     * DatasetMeta instead of unknown.
+     */
+    async queryMetadata(
+        source: "opendosm" | "data_catalogue",
+        datasetId: string
+    ): Promise<DatasetMeta> {
+        const data =
+            source === "opendosm"
+                ? await this.queryOpenDOSM(datasetId, { metaOnly: true })
+                : await this.queryDataCatalogue(datasetId, { metaOnly: true });
 
-        if (metaOnly) {
-            params.append("meta_only", "true");
-        } else {
-            params.append("limit", limit.toString());
-            params.append("offset", offset.toString());
+        if (!isDatasetMeta(data)) {
+            throw new Error(
+                `Unexpected metadata response for dataset '${datasetId}'`
+            );
         }
+        return data;
+    }
 
-        if (filters) {
-            Object.entries(filters).forEach(([key, value]) => {
-                params.append(key, String(value));
-            });
-        }
+    /**
+     * Fetch metadata and a small data sample together. Some data.gov.my
+     * endpoints include `meta` and `data` keys in a single response when
+     * meta_only is not set; when they do, one round trip serves both.
+     * Endpoints that return bare records fall back to a second metadata
+     * request, and the answer is remembered per source so later calls go
+     * straight to the right shape (two parallel requests on the fallback
+     * path).
+     */
+    async queryWithMeta(
+        source: "opendosm" | "data_catalogue",
+        datasetId: string,
+        limit = 3
+    ): Promise<{ meta: unknown; data: unknown }> {
+        const query =
+            source === "opendosm"
+                ? this.queryOpenDOSM.bind(this)
+                : this.queryDataCatalogue.bind(this);
 
-        this.abortController = new AbortController();
-        const url = `${DATA_CATALOGUE_BASE_URL}?${params.toString()}`;
-        const response = await fetch(url, {
-            signal: this.abortController.signal,
-            headers: {
-                "Accept": "application/json",
-            },
-        });
+        if (this.combinedMetaSupport.get(source) === false) {
+            const [meta, data] = await Promise.all([
+                query(datasetId, { metaOnly: true }),
+                query(datasetId, { limit }),
+            ]);
+            return { meta, data };
+        }
 
-        if (!response.ok) {
-            throw new Error(
-                `Data Catalogue API error: ${response.status} ${response.statusText}`
-            );
+        const combined = await query(datasetId, { limit });
+        if (
+            combined !== null &&
+            typeof combined === "object" &&
+            !Array.isArray(combined) &&
+            "meta" in combined &&
+            "data" in combined
+        ) {
+            this.combinedMetaSupport.set(source, true);
+            const { meta, data } = combined as { meta: unknown; data: unknown };
+            return { meta, data };
         }
 
-        return response.json();
+        // Not supported: the response above is already the sample data, so
+        // only the metadata request remains.
+        this.combinedMetaSupport.set(source, false);
+        const meta = await query(datasetId, { metaOnly: true });
+        return { meta, data: combined };
+    }
+
+    /**
+     * Query a dataset and yield its records one at a time. Array payloads
+     * are iterated element-wise so consumers can process and release rows
+     * incrementally instead of materializing a second full copy (e.g. when
+     * re-serializing record-per-line); non-array payloads are yielded
+     * whole.
+     */
+    async *queryRecords(
+        source: "opendosm" | "data_catalogue",
+        datasetId: string,
+        options: QueryOptions = {}
+    ): AsyncGenerator<unknown, void, undefined> {
+        const data =
+            source === "opendosm"
+                ? await this.queryOpenDOSM(datasetId, options)
+                : await this.queryDataCatalogue(datasetId, options);
+
+        if (Array.isArray(data)) {
+            yield* data;
+        } else {
+            yield data;
+        }
     }
 
     /**
@@ -112,3 +387,17 @@ export class DataGovMyClient {
         }
     }
 }
+
+let sharedClient: DataGovMyClient | null = null;
+
+/**
+ * Get the process-wide client, creating it on first use. Embedders and
+ * tests that run multiple servers in one process share a single
+ * connection pool instead of constructing a client each.
+ */
+export function getSharedClient(): DataGovMyClient {
+    if (!sharedClient) {
+        sharedClient = new DataGovMyClient();
+    }
+    return sharedClient;
+}
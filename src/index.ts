@@ -11,8 +11,8 @@ import {
     ListToolsRequestSchema,
     ReadResourceRequestSchema,
 } from "@modelcontextprotocol/sdk/types.js";
-import { DataGovMyClient } from "./client.js";
-import datasetsIndex from "./datasets.json" with { type: "json" };
+import { existsSync, readFileSync } from "node:fs";
+import { getSharedClient, type QueryOptions } from "./client.js";
 
 // Type for dataset index
 interface Dataset {
@@ -34,11 +34,14 @@ interface QueryToolArgs {
     filters?: string;
     limit?: number;
     offset?: number;
+    format?: "json" | "ndjson";
+    pretty?: boolean;
 }
 
 interface MetadataToolArgs {
     dataset_id: string;
     source: "opendosm" | "data_catalogue";
+    pretty?: boolean;
 }
 
 interface ListDatasetsArgs {
@@ -46,15 +49,216 @@ interface ListDatasetsArgs {
     category?: string;
     limit?: number;
     offset?: number;
+    pretty?: boolean;
 }
 
 interface SearchDatasetsArgs {
     query: string;
     source?: "opendosm" | "data_catalogue";
     limit?: number;
+    pretty?: boolean;
 }
 
-const DATASETS_INDEX = datasetsIndex as DatasetsIndex;
+function loadDatasetsIndex(): DatasetsIndex {
+    // Next to the module when running from src/; compiled dist/ builds fall
+    // back to the src/datasets.json shipped in the package.
+    const candidates = [
+        new URL("./datasets.json", import.meta.url),
+        new URL("../src/datasets.json", import.meta.url),
+    ];
+    for (const url of candidates) {
+        if (existsSync(url)) {
+            return JSON.parse(readFileSync(url, "utf-8")) as DatasetsIndex;
+        }
+    }
+    throw new Error("datasets.json not found next to the server module");
+}
+
+const DATASETS_INDEX = loadDatasetsIndex();
+
+// Per-source dataset lists with the source field baked in, built once at
+// startup so list/search don't re-copy every dataset on each call.
+type SourcedDataset = Dataset & { source: "opendosm" | "data_catalogue" };
+
+const OPENDOSM_DATASETS: readonly SourcedDataset[] = DATASETS_INDEX.opendosm.map(
+    (d) => ({ ...d, source: "opendosm" as const })
+);
+const CATALOGUE_DATASETS: readonly SourcedDataset[] =
+    DATASETS_INDEX.data_catalogue.map((d) => ({
+        ...d,
+        source: "data_catalogue" as const,
+    }));
+const ALL_DATASETS: readonly SourcedDataset[] = [
+    ...OPENDOSM_DATASETS,
+    ...CATALOGUE_DATASETS,
+];
+
+function datasetsForSource(
+    source?: "opendosm" | "data_catalogue"
+): readonly SourcedDataset[] {
+    if (source === "opendosm") {
+        return OPENDOSM_DATASETS;
+    }
+    if (source === "data_catalogue") {
+        return CATALOGUE_DATASETS;
+    }
+    return ALL_DATASETS;
+}
+
+// Inverted search index built once at startup: token -> [weight, dataset]
+// postings. Field weights mirror the old substring scores (id 50, name 30,
+// description 10, keyword 20); exact-ID and exact-keyword bonuses are
+// applied at query time. Searching then only touches datasets whose tokens
+// actually match instead of rescoring the whole catalogue per query.
+const SEARCH_INDEX = new Map<string, Array<[number, SourcedDataset]>>();
+const ID_MAP = new Map<string, SourcedDataset[]>();
+const KEYWORD_MAP = new Map<string, SourcedDataset[]>();
+
+function tokenize(text: string): string[] {
+    return text.toLowerCase().split(/[^a-z0-9]+/).filter(Boolean);
+}
+
+function pushEntry<T>(map: Map<string, T[]>, key: string, value: T) {
+    const entries = map.get(key);
+    if (entries) {
+        entries.push(value);
+    } else {
+        map.set(key, [value]);
+    }
+}
+
+for (const dataset of ALL_DATASETS) {
+    const fields: Array<[string, number]> = [
+        [dataset.id, 50],
+        [dataset.name, 30],
+        [dataset.description, 10],
+    ];
+    for (const keyword of dataset.keywords || []) {
+        fields.push([keyword, 20]);
+        pushEntry(KEYWORD_MAP, keyword.toLowerCase(), dataset);
+    }
+    for (const [text, weight] of fields) {
+        for (const token of new Set(tokenize(text))) {
+            pushEntry(SEARCH_INDEX, token, [weight, dataset]);
+        }
+    }
+    pushEntry(ID_MAP, dataset.id.toLowerCase(), dataset);
+}
+
+// Lowercased search fields cached once per dataset so the fallback
+// substring scan doesn't re-lowercase every field on every query. Kept in
+// a parallel structure rather than on the dataset objects themselves so
+// they never leak into tool output.
+interface SearchRecord {
+    dataset: SourcedDataset;
+    idLower: string;
+    nameLower: string;
+    descLower: string;
+    keywordsLower: readonly string[];
+}
+
+const SEARCH_RECORDS: readonly SearchRecord[] = ALL_DATASETS.map((d) => ({
+    dataset: d,
+    idLower: d.id.toLowerCase(),
+    nameLower: d.name.toLowerCase(),
+    descLower: d.description.toLowerCase(),
+    keywordsLower: (d.keywords || []).map((k) => k.toLowerCase()),
+}));
+
+// Constant-time lookup of dataset info by source and ID
+const INFO_BY_SOURCE_ID = new Map<string, SourcedDataset>(
+    ALL_DATASETS.map((d) => [`${d.source}:${d.id}`, d])
+);
+
+// Resource bodies rendered once at startup; the dataset index is static
+// for the life of the process, so the Markdown is too.
+const OPENDOSM_MD =
+    "# OpenDOSM Datasets\n\n" +
+    DATASETS_INDEX.opendosm
+        .map((d) => `- **${d.id}**: ${d.name} - ${d.description}`)
+        .join("\n");
+
+const CATALOGUE_MD =
+    "# Data Catalogue Datasets\n\n" +
+    DATASETS_INDEX.data_catalogue
+        .map((d) => `- **${d.id}**: ${d.name} - ${d.description}`)
+        .join("\n");
+
+const POPULAR_MD =
+    "# Popular Datasets\n\n" +
+    [
+        ...DATASETS_INDEX.opendosm
+            .slice(0, 10)
+            .map((d) => `- **${d.id}** (OpenDOSM): ${d.name}`),
+        ...DATASETS_INDEX.data_catalogue
+            .slice(0, 10)
+            .map((d) => `- **${d.id}** (Data Catalogue): ${d.name}`),
+    ].join("\n");
+
+// Shared schema fragment for the per-tool pretty flag
+const PRETTY_SCHEMA = {
+    type: "boolean",
+    description: "Pretty-print the JSON response (default: false)",
+    default: false,
+} as const;
+
+// Shared schema fragment for the query tools' output format
+const FORMAT_SCHEMA = {
+    type: "string",
+    description:
+        "Response format - 'json' for a single document or 'ndjson' for one record per line (default: 'json')",
+    enum: ["json", "ndjson"],
+    default: "json",
+} as const;
+
+/**
+ * Serialize a tool result. Compact by default: responses are consumed by
+ * programs, and indenting multi-MB dataset payloads roughly doubles the
+ * bytes shipped over stdio.
+ */
+function jsonText(data: unknown, pretty = false): string {
+    return pretty ? JSON.stringify(data, null, 2) : JSON.stringify(data);
+}
+
+// Upper bound on the filters JSON blob; real filter objects are tiny, and
+// the cap keeps pathological inputs from burning parse CPU.
+const MAX_FILTERS_CHARS = 8192;
+
+/**
+ * Parse a tool's optional filters argument, enforcing a size cap and that
+ * the payload is a JSON object.
+ */
+function parseFilters(filters?: string): Record<string, unknown> | undefined {
+    if (filters === undefined) {
+        return undefined;
+    }
+    if (filters.length > MAX_FILTERS_CHARS) {
+        throw new Error(
+            `filters too large (${filters.length} > ${MAX_FILTERS_CHARS} characters)`
+        );
+    }
+    const parsed: unknown = JSON.parse(filters);
+    if (parsed === null || typeof parsed !== "object" || Array.isArray(parsed)) {
+        throw new Error("filters must be a JSON object");
+    }
+    return parsed as Record<string, unknown>;
+}
+
+/**
+ * Serialize a query result as NDJSON, one compact record per line, so
+ * streaming consumers can process lines as they split them off.
+ */
+async function ndjsonText(
+    source: "opendosm" | "data_catalogue",
+    datasetId: string,
+    options: QueryOptions
+): Promise<string> {
+    const lines: string[] = [];
+    for await (const record of apiClient.queryRecords(source, datasetId, options)) {
+        lines.push(JSON.stringify(record));
+    }
+    return lines.join("\n");
+}
 
 // Create server and client
 const server = new Server(
@@ -70,7 +274,7 @@ const server = new Server(
     }
 );
 
-const apiClient = new DataGovMyClient();
+const apiClient = getSharedClient();
 
 // List available tools
 server.setRequestHandler(ListToolsRequestSchema, () => {
@@ -91,7 +295,7 @@ server.setRequestHandler(ListToolsRequestSchema, () => {
                         filters: {
                             type: "string",
                             description:
-                                'Optional JSON string of filter parameters (e.g., \'{"date": "2024-01-01"}\')',
+                                'Optional JSON string of filter parameters (e.g., \'{"date": "2024-01-01"}\'). The key "nocache": true is handled client-side: it bypasses the response cache and is not sent upstream.',
                         },
                         limit: {
                             type: "number",
@@ -104,6 +308,8 @@ server.setRequestHandler(ListToolsRequestSchema, () => {
                                 "Number of records to skip for pagination (default: 0)",
                             default: 0,
                         },
+                        format: FORMAT_SCHEMA,
+                        pretty: PRETTY_SCHEMA,
                     },
                     required: ["dataset_id"],
                 },
@@ -122,7 +328,7 @@ server.setRequestHandler(ListToolsRequestSchema, () => {
                         filters: {
                             type: "string",
                             description:
-                                'Optional JSON string of filter parameters (e.g., \'{"date": "2024-01-01"}\')',
+                                'Optional JSON string of filter parameters (e.g., \'{"date": "2024-01-01"}\'). The key "nocache": true is handled client-side: it bypasses the response cache and is not sent upstream.',
                         },
                         limit: {
                             type: "number",
@@ -135,6 +341,8 @@ server.setRequestHandler(ListToolsRequestSchema, () => {
                                 "Number of records to skip for pagination (default: 0)",
                             default: 0,
                         },
+                        format: FORMAT_SCHEMA,
+                        pretty: PRETTY_SCHEMA,
                     },
                     required: ["dataset_id"],
                 },
@@ -156,6 +364,7 @@ server.setRequestHandler(ListToolsRequestSchema, () => {
                                 "Data source - either 'opendosm' or 'data_catalogue'",
                             enum: ["opendosm", "data_catalogue"],
                         },
+                        pretty: PRETTY_SCHEMA,
                     },
                     required: ["dataset_id", "source"],
                 },
@@ -188,6 +397,7 @@ server.setRequestHandler(ListToolsRequestSchema, () => {
                                 "Number of datasets to skip for pagination (default: 0)",
                             default: 0,
                         },
+                        pretty: PRETTY_SCHEMA,
                     },
                 },
             },
@@ -213,6 +423,7 @@ server.setRequestHandler(ListToolsRequestSchema, () => {
                             description: "Maximum number of results to return (default: 10)",
                             default: 10,
                         },
+                        pretty: PRETTY_SCHEMA,
                     },
                     required: ["query"],
                 },
@@ -233,10 +444,22 @@ server.setRequestHandler(ListToolsRequestSchema, () => {
                                 "Data source - either 'opendosm' or 'data_catalogue'",
                             enum: ["opendosm", "data_catalogue"],
                         },
+                        pretty: PRETTY_SCHEMA,
                     },
                     required: ["dataset_id", "source"],
                 },
             },
+            {
+                name: "clear_cache",
+                description:
+                    "Clear the API response cache and report the statistics it had accumulated",
+                inputSchema: {
+                    type: "object",
+                    properties: {
+                        pretty: PRETTY_SCHEMA,
+                    },
+                },
+            },
         ],
     };
 });
@@ -248,91 +471,99 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
     try {
         switch (name) {
             case "query_opendosm": {
-                const { dataset_id, filters, limit = 100, offset = 0 } = args as unknown as QueryToolArgs;
-                const filterDict = filters ? JSON.parse(filters) as Record<string, unknown> : undefined;
+                const { dataset_id, filters, limit = 100, offset = 0, format = "json", pretty = false } = args as unknown as QueryToolArgs;
+                if (format !== "json" && format !== "ndjson") {
+                    throw new Error("Invalid format. Must be 'json' or 'ndjson'");
+                }
 
-                const data = await apiClient.queryOpenDOSM(dataset_id, {
-                    filters: filterDict,
-                    limit,
-                    offset,
-                });
+                const options = { filters: parseFilters(filters), limit, offset };
+
+                if (format === "ndjson") {
+                    return {
+                        content: [
+                            {
+                                type: "text",
+                                text: await ndjsonText("opendosm", dataset_id, options),
+                            },
+                        ],
+                    };
+                }
+
+                const data = await apiClient.queryOpenDOSM(dataset_id, options);
 
                 return {
                     content: [
                         {
                             type: "text",
-                            text: JSON.stringify(data, null, 2),
+                            text: jsonText(data, pretty),
                         },
                     ],
                 };
             }
 
             case "query_data_catalogue": {
-                const { dataset_id, filters, limit = 100, offset = 0 } = args as unknown as QueryToolArgs;
-                const filterDict = filters ? JSON.parse(filters) as Record<string, unknown> : undefined;
+                const { dataset_id, filters, limit = 100, offset = 0, format = "json", pretty = false } = args as unknown as QueryToolArgs;
+                if (format !== "json" && format !== "ndjson") {
+                    throw new Error("Invalid format. Must be 'json' or 'ndjson'");
+                }
 
-                const data = await apiClient.queryDataCatalogue(dataset_id, {
-                    filters: filterDict,
-                    limit,
-                    offset,
-                });
+                const options = { filters: parseFilters(filters), limit, offset };
+
+                if (format === "ndjson") {
+                    return {
+                        content: [
+                            {
+                                type: "text",
+                                text: await ndjsonText("data_catalogue", dataset_id, options),
+                            },
+                        ],
+                    };
+                }
+
+                const data = await apiClient.queryDataCatalogue(dataset_id, options);
 
                 return {
                     content: [
                         {
                             type: "text",
-                            text: JSON.stringify(data, null, 2),
+                            text: jsonText(data, pretty),
                         },
                     ],
                 };
             }
 
             case "get_dataset_metadata": {
-                const { dataset_id, source } = args as unknown as MetadataToolArgs;
-
-                let data;
-                if (source === "opendosm") {
-                    data = await apiClient.queryOpenDOSM(dataset_id, { metaOnly: true });
-                } else if (source === "data_catalogue") {
-                    data = await apiClient.queryDataCatalogue(dataset_id, {
-                        metaOnly: true,
-                    });
-                } else {
+                const { dataset_id, source, pretty = false } = args as unknown as MetadataToolArgs;
+
+                if (source !== "opendosm" && source !== "data_catalogue") {
                     throw new Error(
                         "Invalid source. Must be 'opendosm' or 'data_catalogue'"
                     );
                 }
 
+                const data = await apiClient.queryMetadata(source, dataset_id);
+
                 return {
                     content: [
                         {
                             type: "text",
-                            text: JSON.stringify(data, null, 2),
+                            text: jsonText(data, pretty),
                         },
                     ],
                 };
             }
 
             case "list_datasets": {
-                const { source, category, limit = 100, offset = 0 } = args as unknown as ListDatasetsArgs;
+                const { source, category, limit = 100, offset = 0, pretty = false } = args as unknown as ListDatasetsArgs;
 
-                let datasets: Array<Dataset & { source: string }> = [];
-
-                // Collect datasets from specified sources
-                if (!source || source === "opendosm") {
-                    datasets.push(
-                        ...DATASETS_INDEX.opendosm.map((d) => ({ ...d, source: "opendosm" }))
-                    );
-                }
-                if (!source || source === "data_catalogue") {
-                    datasets.push(
-                        ...DATASETS_INDEX.data_catalogue.map((d) => ({
-                            ...d,
-                            source: "data_catalogue",
-                        }))
+                if (source !== undefined && source !== "opendosm" && source !== "data_catalogue") {
+                    throw new Error(
+                        "Invalid source. Must be 'opendosm' or 'data_catalogue'"
                     );
                 }
 
+                let datasets = datasetsForSource(source);
+
                 // Filter by category if specified
                 if (category) {
                     datasets = datasets.filter(
@@ -356,71 +587,87 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
                     content: [
                         {
                             type: "text",
-                            text: JSON.stringify(result, null, 2),
+                            text: jsonText(result, pretty),
                         },
                     ],
                 };
             }
 
             case "search_datasets": {
-                const { query, source, limit = 10 } = args as unknown as SearchDatasetsArgs;
+                const { query, source, limit = 10, pretty = false } = args as unknown as SearchDatasetsArgs;
+
+                if (source !== undefined && source !== "opendosm" && source !== "data_catalogue") {
+                    throw new Error(
+                        "Invalid source. Must be 'opendosm' or 'data_catalogue'"
+                    );
+                }
+
                 const queryLower = query.toLowerCase();
 
-                const datasets: Array<Dataset & { source: string }> = [];
+                const scores = new Map<SourcedDataset, number>();
+                const inSource = (d: SourcedDataset) => !source || d.source === source;
 
-                // Collect datasets from specified sources
-                if (!source || source === "opendosm") {
-                    datasets.push(
-                        ...DATASETS_INDEX.opendosm.map((d) => ({ ...d, source: "opendosm" }))
-                    );
+                // Look up each query token in the inverted index
+                for (const token of new Set(tokenize(queryLower))) {
+                    for (const [weight, dataset] of SEARCH_INDEX.get(token) || []) {
+                        if (inSource(dataset)) {
+                            scores.set(dataset, (scores.get(dataset) || 0) + weight);
+                        }
+                    }
                 }
-                if (!source || source === "data_catalogue") {
-                    datasets.push(
-                        ...DATASETS_INDEX.data_catalogue.map((d) => ({
-                            ...d,
-                            source: "data_catalogue",
-                        }))
-                    );
+
+                // Exact-match bonuses for the full query string
+                for (const dataset of ID_MAP.get(queryLower) || []) {
+                    if (inSource(dataset)) {
+                        scores.set(dataset, (scores.get(dataset) || 0) + 100);
+                    }
+                }
+                for (const dataset of KEYWORD_MAP.get(queryLower) || []) {
+                    if (inSource(dataset)) {
+                        scores.set(dataset, (scores.get(dataset) || 0) + 40);
+                    }
                 }
 
-                // Search and rank results
-                const scoredDatasets: Array<[number, Dataset & { source: string }]> = [];
+                // Substring scan over the cached lowercased fields. This
+                // always runs so datasets that only match by substring
+                // (e.g. "price" inside "fuelprice") are never dropped; the
+                // per-dataset score is the max of index and substring
+                // scores, so the index acts as a ranking booster. At this
+                // catalogue's size the scan is cheap.
+                for (const record of SEARCH_RECORDS) {
+                    if (!inSource(record.dataset)) {
+                        continue;
+                    }
 
-                for (const dataset of datasets) {
                     let score = 0;
 
-                    // Exact ID match gets highest score
-                    if (queryLower === dataset.id.toLowerCase()) {
-                        score += 100;
-                    } else if (dataset.id.toLowerCase().includes(queryLower)) {
+                    if (record.idLower.includes(queryLower)) {
                         score += 50;
                     }
-
-                    // Name matching
-                    if (dataset.name.toLowerCase().includes(queryLower)) {
+                    if (record.nameLower.includes(queryLower)) {
                         score += 30;
                     }
-
-                    // Description matching
-                    if (dataset.description.toLowerCase().includes(queryLower)) {
+                    if (record.descLower.includes(queryLower)) {
                         score += 10;
                     }
-
-                    // Keyword matching
-                    for (const keyword of dataset.keywords || []) {
-                        if (queryLower === keyword.toLowerCase()) {
-                            score += 40;
-                        } else if (keyword.toLowerCase().includes(queryLower)) {
+                    for (const keyword of record.keywordsLower) {
+                        if (keyword.includes(queryLower)) {
                             score += 20;
                         }
                     }
 
                     if (score > 0) {
-                        scoredDatasets.push([score, dataset]);
+                        scores.set(
+                            record.dataset,
+                            Math.max(scores.get(record.dataset) || 0, score)
+                        );
                     }
                 }
 
                 // Sort by score (descending) and apply limit
+                const scoredDatasets = [...scores.entries()].map(
+                    ([dataset, score]): [number, SourcedDataset] => [score, dataset]
+                );
                 scoredDatasets.sort((a, b) => b[0] - a[0]);
                 const results = scoredDatasets.slice(0, limit).map(([_, dataset]) => dataset);
 
@@ -434,46 +681,30 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
                     content: [
                         {
                             type: "text",
-                            text: JSON.stringify(result, null, 2),
+                            text: jsonText(result, pretty),
                         },
                     ],
                 };
             }
 
             case "get_dataset_schema": {
-                const { dataset_id, source } = args as unknown as MetadataToolArgs;
-
-                // Get dataset info from index
-                const sourceKey: keyof DatasetsIndex = source === "opendosm" ? "opendosm" : "data_catalogue";
-                const datasetInfo = DATASETS_INDEX[sourceKey]?.find(
-                    (ds) => ds.id === dataset_id
-                );
+                const { dataset_id, source, pretty = false } = args as unknown as MetadataToolArgs;
 
-                // Get metadata from API
-                let metadata;
-                if (source === "opendosm") {
-                    metadata = await apiClient.queryOpenDOSM(dataset_id, {
-                        metaOnly: true,
-                    });
-                } else if (source === "data_catalogue") {
-                    metadata = await apiClient.queryDataCatalogue(dataset_id, {
-                        metaOnly: true,
-                    });
-                } else {
+                if (source !== "opendosm" && source !== "data_catalogue") {
                     throw new Error(
                         "Invalid source. Must be 'opendosm' or 'data_catalogue'"
                     );
                 }
 
-                // Get sample data
-                let sampleData;
-                if (source === "opendosm") {
-                    sampleData = await apiClient.queryOpenDOSM(dataset_id, { limit: 3 });
-                } else {
-                    sampleData = await apiClient.queryDataCatalogue(dataset_id, {
-                        limit: 3,
-                    });
-                }
+                // Get dataset info from index
+                const datasetInfo = INFO_BY_SOURCE_ID.get(
+                    `${source}:${dataset_id}`
+                );
+
+                // One round trip when the endpoint returns meta alongside
+                // data; two parallel requests otherwise.
+                const { meta: metadata, data: sampleData } =
+                    await apiClient.queryWithMeta(source, dataset_id, 3);
 
                 const result = {
                     dataset_id,
@@ -487,7 +718,22 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
                     content: [
                         {
                             type: "text",
-                            text: JSON.stringify(result, null, 2),
+                            text: jsonText(result, pretty),
+                        },
+                    ],
+                };
+            }
+
+            case "clear_cache": {
+                const { pretty = false } = args as unknown as { pretty?: boolean };
+                const stats = apiClient.cacheStats();
+                apiClient.clearCache();
+
+                return {
+                    content: [
+                        {
+                            type: "text",
+                            text: jsonText({ cleared: true, stats }, pretty),
                         },
                     ],
                 };
@@ -550,58 +796,38 @@ server.setRequestHandler(ReadResourceRequestSchema, (request) => {
     const { uri } = request.params;
 
     switch (uri) {
-        case "dataset://opendosm/all": {
-            const datasets = DATASETS_INDEX.opendosm
-                .map((d) => `- **${d.id}**: ${d.name} - ${d.description}`)
-                .join("\n");
+        case "dataset://opendosm/all":
             return {
                 contents: [
                     {
                         uri,
                         mimeType: "text/markdown",
-                        text: `# OpenDOSM Datasets\n\n${datasets}`,
+                        text: OPENDOSM_MD,
                     },
                 ],
             };
-        }
 
-        case "dataset://data-catalogue/all": {
-            const datasets = DATASETS_INDEX.data_catalogue
-                .map((d) => `- **${d.id}**: ${d.name} - ${d.description}`)
-                .join("\n");
+        case "dataset://data-catalogue/all":
             return {
                 contents: [
                     {
                         uri,
                         mimeType: "text/markdown",
-                        text: `# Data Catalogue Datasets\n\n${datasets}`,
+                        text: CATALOGUE_MD,
                     },
                 ],
             };
-        }
-
-        case "dataset://popular": {
-            const popular: string[] = [];
-
-            // Get first 10 from each source
-            DATASETS_INDEX.opendosm.slice(0, 10).forEach((d) => {
-                popular.push(`- **${d.id}** (OpenDOSM): ${d.name}`);
-            });
-
-            DATASETS_INDEX.data_catalogue.slice(0, 10).forEach((d) => {
-                popular.push(`- **${d.id}** (Data Catalogue): ${d.name}`);
-            });
 
+        case "dataset://popular":
             return {
                 contents: [
                     {
                         uri,
                         mimeType: "text/markdown",
-                        text: `# Popular Datasets\n\n${popular.join("\n")}`,
+                        text: POPULAR_MD,
                     },
                 ],
             };
-        }
 
         default:
             throw new Error(`Unknown resource: ${uri}`);